@@ -967,7 +967,8 @@ def invalid_args_id(args):
 
 @pytest.fixture(scope="function", params=_invalid_args, ids=invalid_args_id)
 def invalid_args(request):
-    return deepcopy(request.param)
+    # Tests only read the invalid arguments, so there is no need to copy them.
+    return request.param
 
 
 def _test_moves_id(args):
@@ -1017,21 +1018,26 @@ def _cpp_args(_valid_args):
         elif 'Convex' in str(integrator):
             cpp_shape = hoomd.hpmc._hpmc.PolyhedronVertices
         if cpp_shape:
-            if isinstance(integrator, tuple):
-                inner_integrator = integrator[0]
-                integrator = integrator[1]
-                inner_mc = inner_integrator()
-                for i in range(len(args["shapes"])):
-                    # This will fill in default values for the inner shape
-                    # objects
-                    inner_mc.shape["A"] = args["shapes"][i]
-                    args["shapes"][i] = inner_mc.shape["A"].to_base()
-            mc = integrator()
-            mc.shape['A'] = args
-            args_list.append((cpp_shape, mc.shape['A'].to_base()))
+            args_list.append((cpp_shape, integrator, args))
     return args_list
 
 
+def _convert_cpp_args(integrator, args):
+    """Fill in the default values of the shape parameters."""
+    if isinstance(integrator, tuple):
+        inner_integrator = integrator[0]
+        integrator = integrator[1]
+        inner_mc = inner_integrator()
+        for i in range(len(args["shapes"])):
+            # This will fill in default values for the inner shape
+            # objects
+            inner_mc.shape["A"] = args["shapes"][i]
+            args["shapes"][i] = inner_mc.shape["A"].to_base()
+    mc = integrator()
+    mc.shape['A'] = args
+    return mc.shape['A'].to_base()
+
+
 @CounterWrapper
 def cpp_args_id(args):
     integrator = args[0]
@@ -1042,4 +1048,7 @@ def cpp_args_id(args):
                 params=_cpp_args(_valid_args),
                 ids=cpp_args_id)
 def cpp_args(request):
-    return deepcopy(request.param)
+    # Convert when the fixture is used rather than when the module is
+    # imported, so collection does not construct integrators for every shape.
+    cpp_shape, integrator, args = request.param
+    return cpp_shape, _convert_cpp_args(integrator, deepcopy(args))
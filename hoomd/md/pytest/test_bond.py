@@ -112,11 +112,27 @@ def snapshot_factory(two_particle_snapshot_factory):
     return make_snapshot
 
 
+@pytest.fixture(scope='module')
+def module_bond_simulation(snapshot_factory, simulation_factory):
+    return simulation_factory(snapshot_factory())
+
+
+@pytest.fixture(scope='function')
+def bond_simulation(module_bond_simulation):
+    """Share one simulation between tests that do not advance the state.
+
+    Tests set the integrator and call ``run(0)``. Remove the integrator after
+    each test so that its forces do not leak into the next.
+    """
+    yield module_bond_simulation
+    module_bond_simulation.operations.integrator = None
+
+
 @pytest.mark.parametrize('bond_cls, bond_args, params, force, energy',
                          bond_test_parameters)
-def test_after_attaching(snapshot_factory, simulation_factory, bond_cls,
-                         bond_args, params, force, energy):
-    sim = simulation_factory(snapshot_factory())
+def test_after_attaching(bond_simulation, bond_cls, bond_args, params, force,
+                         energy):
+    sim = bond_simulation
 
     potential = bond_cls(**bond_args)
     potential.params['A-A'] = params
@@ -131,9 +147,9 @@ def test_after_attaching(snapshot_factory, simulation_factory, bond_cls,
 
 @pytest.mark.parametrize('bond_cls, bond_args, params, force, energy',
                          bond_test_parameters)
-def test_forces_and_energies(snapshot_factory, simulation_factory, bond_cls,
-                             bond_args, params, force, energy):
-    sim = simulation_factory(snapshot_factory())
+def test_forces_and_energies(bond_simulation, bond_cls, bond_args, params,
+                             force, energy):
+    sim = bond_simulation
 
     potential = bond_cls(**bond_args)
     potential.params['A-A'] = params
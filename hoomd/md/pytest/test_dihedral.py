@@ -147,6 +147,12 @@ def test_forces_and_energies(dihedral_snapshot_factory, simulation_factory,
     force_array = force * numpy.asarray(
         [0, numpy.sin(-phi_rad / 2),
          numpy.cos(-phi_rad / 2)])
+    expected_forces = numpy.array([
+        force_array,
+        -1 * force_array,
+        [0, -1 * force_array[1], force_array[2]],
+        [0, force_array[1], -1 * force_array[2]],
+    ])
     potential = dihedral_cls(**dihedral_args)
     potential.params['A-A-A-A'] = params
 
@@ -159,20 +165,8 @@ def test_forces_and_energies(dihedral_snapshot_factory, simulation_factory,
     sim_forces = potential.forces
     if sim.device.communicator.rank == 0:
         assert sum(sim_energies) == pytest.approx(energy, rel=1e-2, abs=1e-5)
-        numpy.testing.assert_allclose(sim_forces[0],
-                                      force_array,
-                                      rtol=1e-2,
-                                      atol=1e-5)
-        numpy.testing.assert_allclose(sim_forces[1],
-                                      -1 * force_array,
-                                      rtol=1e-2,
-                                      atol=1e-5)
-        numpy.testing.assert_allclose(sim_forces[2],
-                                      [0, -1 * force_array[1], force_array[2]],
-                                      rtol=1e-2,
-                                      atol=1e-5)
-        numpy.testing.assert_allclose(sim_forces[3],
-                                      [0, force_array[1], -1 * force_array[2]],
+        numpy.testing.assert_allclose(sim_forces,
+                                      expected_forces,
                                       rtol=1e-2,
                                       atol=1e-5)
 
@@ -181,3 +181,136 @@ def test_type_handling(tmp_path, create_md_sim):
             for key in loggables:
                 type_ = key if key not in (float, int, bool) else np.dtype(key)
                 assert fh[f"hoomd-data/{str(key)}"].dtype == type_
+
+
+def test_write_buffer(tmp_path, create_md_sim):
+    logger = hoomd.logging.Logger(categories=['scalar'])
+    sim = create_md_sim
+    fn = tmp_path / "buffer.h5"
+    logger[("foo", "bar")] = (lambda: sim.timestep, "scalar")
+    # Buffer two frames of the single 8 byte scalar quantity at a time.
+    hdf5_writer = hoomd.write.HDF5Log(1,
+                                      fn,
+                                      logger,
+                                      mode="w",
+                                      maximum_write_buffer_size=16)
+    assert hdf5_writer.maximum_write_buffer_size == 16
+    sim.operations.writers.append(hdf5_writer)
+    sim.run(5)
+    if sim.device.communicator.rank == 0:
+        with h5py.File(fn, "r") as fh:
+            assert fh["hoomd-data"].attrs["frames"] == 4
+    hdf5_writer.flush()
+    if sim.device.communicator.rank == 0:
+        with h5py.File(fn, "r") as fh:
+            assert fh["hoomd-data"].attrs["frames"] == 5
+            assert list(fh["hoomd-data/foo/bar"]) == [1, 2, 3, 4, 5]
+
+
+def test_removed_quantity(tmp_path, create_md_sim):
+    logger = hoomd.logging.Logger(categories=['scalar'])
+    sim = create_md_sim
+    fn = tmp_path / "removed.h5"
+    logger[("foo", "bar")] = (lambda: sim.timestep, "scalar")
+    logger[("foo", "baz")] = (lambda: 42.0, "scalar")
+    hdf5_writer = hoomd.write.HDF5Log(1, fn, logger, mode="w")
+    sim.operations.writers.append(hdf5_writer)
+    sim.run(2)
+    logger.remove(quantities=[("foo", "baz")])
+    sim.run(2)
+    hdf5_writer.flush()
+    if sim.device.communicator.rank == 0:
+        with h5py.File(fn, "r") as fh:
+            assert list(fh["hoomd-data/foo/bar"]) == [1, 2, 3, 4]
+            baz = fh["hoomd-data/foo/baz"]
+            assert list(baz) == [42.0, 42.0, baz.fillvalue, baz.fillvalue]
+
+
+@pytest.mark.serial
+def test_append_unwritten_datasets(tmp_path, create_md_sim):
+    logger = hoomd.logging.Logger(categories=['scalar'])
+    sim = create_md_sim
+    fn = tmp_path / "unwritten.h5"
+    logger[("foo", "bar")] = (lambda: sim.timestep, "scalar")
+    # A file left by a run that stopped before writing its first frames.
+    with h5py.File(fn, "w") as fh:
+        group = fh.create_group("hoomd-data")
+        group.attrs["hoomd-schema"] = [0, 1]
+        group.attrs["frames"] = 0
+        group.create_dataset("foo/bar", (0,),
+                             dtype="i8",
+                             chunks=(512,),
+                             maxshape=(None,))
+    hdf5_writer = hoomd.write.HDF5Log(1, fn, logger, mode="a")
+    sim.operations.writers.append(hdf5_writer)
+    sim.run(3)
+    hdf5_writer.flush()
+    with h5py.File(fn, "r") as fh:
+        assert fh["hoomd-data"].attrs["frames"] == 3
+        assert list(fh["hoomd-data/foo/bar"]) == [1, 2, 3]
+
+
+@pytest.mark.parametrize("compression", [None, "gzip", "lzf"])
+def test_compression(tmp_path, create_md_sim, compression):
+    logger = hoomd.logging.Logger(categories=['scalar', 'sequence'])
+    sim = create_md_sim
+    fn = tmp_path / "compression.h5"
+    logger[("foo", "scalar")] = (lambda: 42.0, "scalar")
+    logger[("foo", "array")] = (lambda: np.arange(100.0), "sequence")
+    hdf5_writer = hoomd.write.HDF5Log(1,
+                                      fn,
+                                      logger,
+                                      mode="w",
+                                      compression=compression)
+    sim.operations.writers.append(hdf5_writer)
+    sim.run(3)
+    hdf5_writer.flush()
+    if sim.device.communicator.rank == 0:
+        with h5py.File(fn, "r") as fh:
+            assert fh["hoomd-data/foo/scalar"].compression is None
+            array = fh["hoomd-data/foo/array"]
+            assert array.compression == compression
+            np.testing.assert_array_equal(array,
+                                          np.tile(np.arange(100.0), (3, 1)))
+
+
+def test_invalid_compression(tmp_path):
+    logger = hoomd.logging.Logger(categories=['scalar'])
+    with pytest.raises(ValueError):
+        hoomd.write.HDF5Log(1, tmp_path / "eg.h5", logger, compression="zip")
+
+
+@pytest.mark.serial
+def test_empty_array(tmp_path, create_md_sim):
+    logger = hoomd.logging.Logger(categories=['sequence'])
+    sim = create_md_sim
+    logger[("foo", "empty")] = (lambda: np.zeros((0, 3)), "sequence")
+    hdf5_writer = hoomd.write.HDF5Log(1,
+                                      tmp_path / "empty.h5",
+                                      logger,
+                                      mode="w")
+    sim.operations.writers.append(hdf5_writer)
+    with pytest.raises(RuntimeError):
+        sim.run(1)
+
+
+@pytest.mark.parametrize("shape, chunks", [
+    ((100_000, 3), (1, (1024 * 1024) // 24, 3)),
+    ((2, 200_000), (1, 1, (1024 * 1024) // 8)),
+])
+def test_large_array_chunks(tmp_path, create_md_sim, shape, chunks):
+    logger = hoomd.logging.Logger(categories=['sequence'])
+    sim = create_md_sim
+    fn = tmp_path / "chunks.h5"
+    large = np.ones(shape)
+    logger[("foo", "large")] = (lambda: large, "sequence")
+    hdf5_writer = hoomd.write.HDF5Log(1, fn, logger, mode="w")
+    sim.operations.writers.append(hdf5_writer)
+    sim.run(2)
+    hdf5_writer.flush()
+    if sim.device.communicator.rank == 0:
+        with h5py.File(fn, "r") as fh:
+            dataset = fh["hoomd-data/foo/large"]
+            # Each chunk holds at most 1 MiB of a single frame.
+            assert dataset.chunks == chunks
+            np.testing.assert_array_equal(dataset, [large, large])
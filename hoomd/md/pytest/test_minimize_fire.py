@@ -18,18 +18,22 @@ def _assert_correct_params(fire, param_dict):
 
 def _make_random_params():
     """Get random values for the fire parameters."""
+    # Draw all values at once from the seeded global generator.
+    (dt, finc_dt, fdec_dt, alpha_start, fdec_alpha, force_tol, angmom_tol,
+     energy_tol) = np.random.rand(8).tolist()
+    min_steps_adapt, min_steps_conv = np.random.randint(1, (25, 15)).tolist()
     params = {
-        'dt': np.random.rand(),
+        'dt': dt,
         'integrate_rotational_dof': False,
-        'min_steps_adapt': np.random.randint(1, 25),
-        'finc_dt': 1 + np.random.rand(),
-        'fdec_dt': np.random.rand(),
-        'alpha_start': np.random.rand(),
-        'fdec_alpha': np.random.rand(),
-        'force_tol': np.random.rand(),
-        'angmom_tol': np.random.rand(),
-        'energy_tol': np.random.rand(),
-        'min_steps_conv': np.random.randint(1, 15)
+        'min_steps_adapt': min_steps_adapt,
+        'finc_dt': 1 + finc_dt,
+        'fdec_dt': fdec_dt,
+        'alpha_start': alpha_start,
+        'fdec_alpha': fdec_alpha,
+        'force_tol': force_tol,
+        'angmom_tol': angmom_tol,
+        'energy_tol': energy_tol,
+        'min_steps_conv': min_steps_conv
     }
     return params
 
@@ -219,11 +219,13 @@ def test_error_on_invalid_body(simulation_factory,
         sim.run(0)
 
 
-@skip_rowan
-def test_running_simulation(simulation_factory, two_particle_snapshot_factory,
-                            valid_body_definition):
-    rigid = md.constrain.Rigid()
-    rigid.body["A"] = valid_body_definition
+def make_rigid_lj_simulation(simulation_factory, two_particle_snapshot_factory,
+                             rigid):
+    """Make a two particle simulation and a rigid body LJ integrator.
+
+    The integrator is not added to the simulation so that tests can create
+    bodies first.
+    """
     langevin = md.methods.Langevin(kT=2.0, filter=hoomd.filter.Rigid())
     lj = hoomd.md.pair.LJ(nlist=md.nlist.Cell(buffer=0.4), mode="shift")
     lj.params.default = {"epsilon": 0.0, "sigma": 1}
@@ -239,6 +241,18 @@ def test_running_simulation(simulation_factory, two_particle_snapshot_factory,
     sim = simulation_factory(initial_snapshot)
     sim.seed = 5
 
+    return sim, integrator
+
+
+@skip_rowan
+def test_running_simulation(simulation_factory, two_particle_snapshot_factory,
+                            valid_body_definition):
+    rigid = md.constrain.Rigid()
+    rigid.body["A"] = valid_body_definition
+    sim, integrator = make_rigid_lj_simulation(simulation_factory,
+                                               two_particle_snapshot_factory,
+                                               rigid)
+
     charges = [1.0, 2.0, 3.0, 4.0]
     rigid.create_bodies(sim.state, charges={"A": charges})
     sim.operations += integrator
@@ -254,20 +268,9 @@ def test_running_simulation(simulation_factory, two_particle_snapshot_factory,
 def test_running_without_body_definition(simulation_factory,
                                          two_particle_snapshot_factory):
     rigid = md.constrain.Rigid()
-    langevin = md.methods.Langevin(kT=2.0, filter=hoomd.filter.Rigid())
-    lj = hoomd.md.pair.LJ(nlist=md.nlist.Cell(buffer=0.4), mode="shift")
-    lj.params.default = {"epsilon": 0.0, "sigma": 1}
-    lj.params[("A", "A")] = {"epsilon": 1.0}
-    lj.params[("B", "B")] = {"epsilon": 1.0}
-    lj.r_cut.default = 2**(1.0 / 6.0)
-    integrator = md.Integrator(dt=0.005, methods=[langevin], forces=[lj])
-    integrator.rigid = rigid
-
-    initial_snapshot = two_particle_snapshot_factory()
-    if initial_snapshot.communicator.rank == 0:
-        initial_snapshot.particles.types = ["A", "B"]
-    sim = simulation_factory(initial_snapshot)
-    sim.seed = 5
+    sim, integrator = make_rigid_lj_simulation(simulation_factory,
+                                               two_particle_snapshot_factory,
+                                               rigid)
 
     sim.operations += integrator
     sim.run(1)
@@ -279,20 +282,9 @@ def test_setting_body_after_attaching(simulation_factory,
                                       valid_body_definition):
     """Test updating body definition without updating sim particles fails."""
     rigid = md.constrain.Rigid()
-    langevin = md.methods.Langevin(kT=2.0, filter=hoomd.filter.Rigid())
-    lj = hoomd.md.pair.LJ(nlist=md.nlist.Cell(buffer=0.4), mode="shift")
-    lj.params.default = {"epsilon": 0.0, "sigma": 1}
-    lj.params[("A", "A")] = {"epsilon": 1.0}
-    lj.params[("B", "B")] = {"epsilon": 1.0}
-    lj.r_cut.default = 2**(1.0 / 6.0)
-    integrator = md.Integrator(dt=0.005, methods=[langevin], forces=[lj])
-    integrator.rigid = rigid
-
-    initial_snapshot = two_particle_snapshot_factory()
-    if initial_snapshot.communicator.rank == 0:
-        initial_snapshot.particles.types = ["A", "B"]
-    sim = simulation_factory(initial_snapshot)
-    sim.seed = 5
+    sim, integrator = make_rigid_lj_simulation(simulation_factory,
+                                               two_particle_snapshot_factory,
+                                               rigid)
 
     sim.operations += integrator
     sim.run(1)
@@ -309,10 +301,10 @@ def test_rigid_body_restart(simulation_factory, valid_body_definition):
 
     if s.communicator.rank == 0:
         s.particles.N = N
-        s.particles.position[:] = [[-0.5, 0, 0]] * N
-        s.particles.body[:] = [x for x in range(N)]
+        s.particles.position[:] = [-0.5, 0, 0]
+        s.particles.body[:] = np.arange(N)
         s.particles.types = ['A', 'B']
-        s.particles.typeid[:] = [0] * N
+        s.particles.typeid[:] = 0
         s.configuration.box = [2, 2, 2, 0, 0, 0]
 
     # create simulation object and add integrator
@@ -24,8 +24,10 @@
 .. skip: start if(h5py_not_available)
 """
 
+import atexit
 import copy
 import functools
+import weakref
 from pathlib import PurePath
 
 import numpy as np
@@ -63,12 +65,45 @@ class _SkipIfNone:
 
 _skip_fh = _SkipIfNone("_fh")
 
+# Track open HDF5 writers to flush their buffers at exit.
+_open_hdf5_writers = weakref.WeakSet()
+
+
+def _flush_open_hdf5_writers():
+    """Flush all open HDF5 writers at exit."""
+    for writer in list(_open_hdf5_writers):
+        writer.flush()
+
+
+atexit.register(_flush_open_hdf5_writers)
+
+
+def _floor_power_of_two(n):
+    """Return the largest power of two less than or equal to ``max(n, 1)``."""
+    return 1 << (max(int(n), 1).bit_length() - 1)
+
+
+def _split_chunk_shape(shape, nbytes, maximum_nbytes):
+    """Return a chunk shape of at most ``maximum_nbytes`` for an array.
+
+    Splits the leading axes first, so chunks hold whole rows when possible.
+    """
+    chunk_shape = list(shape)
+    for axis, length in enumerate(shape):
+        if nbytes <= maximum_nbytes:
+            break
+        slice_nbytes = nbytes // length
+        chunk_shape[axis] = max(maximum_nbytes // slice_nbytes, 1)
+        nbytes = slice_nbytes * chunk_shape[axis]
+    return tuple(chunk_shape)
+
 
 class _HDF5LogInternal(custom._InternalAction):
     """A HDF5 HOOMD logging backend."""
 
     _skip_for_equality = custom._InternalAction._skip_for_equality | {
-        "_fh", "_attached_"
+        "_fh", "_attached_", "_data_group", "_buffers", "_buffered_frames",
+        "_buffer_capacity"
     }
 
     flags = (
@@ -87,14 +122,29 @@ class _HDF5LogInternal(custom._InternalAction):
 
     _SCALAR_CHUNK = 512
     _MULTIFRAME_ARRAY_CHUNK_MAXIMUM = 4096
-
-    def __init__(self, filename, logger, mode="a"):
+    _SPLIT_ARRAY_CHUNK_MAXIMUM = 1024 * 1024
+    # The chunk cache holds the partially written last chunk of each dataset
+    # between buffered writes. 8 MiB fits the last chunks of 2048 scalar
+    # quantities at a fixed memory cost per open file. The number of hash
+    # slots is a prime about 10 times the number of cached scalar chunks.
+    _CHUNK_CACHE_SIZE = 8 * 1024 * 1024
+    _CHUNK_CACHE_SLOTS = 20483
+
+    def __init__(self,
+                 filename,
+                 logger,
+                 mode="a",
+                 maximum_write_buffer_size=64 * 1024 * 1024,
+                 compression=None):
         if h5py is None:
             raise ImportError(f"{type(self)} requires the h5py pacakge.")
         param_dict = ParameterDict(filename=typeconverter.OnlyTypes(
             (str, PurePath)),
                                    logger=logging.Logger,
-                                   mode=str)
+                                   mode=str,
+                                   maximum_write_buffer_size=int,
+                                   compression=typeconverter.OnlyFrom(
+                                       ("gzip", "lzf"), allow_none=True))
         if (rejects := self._reject_categories
                 & logger.categories) != logging.LoggerCategories["NONE"]:
             reject_str = logging.LoggerCategories._get_string_list(rejects)
@@ -102,24 +152,39 @@ class _HDF5LogInternal(custom._InternalAction):
         param_dict.update({
             "filename": filename,
             "logger": logger,
-            "mode": mode
+            "mode": mode,
+            "maximum_write_buffer_size": maximum_write_buffer_size,
+            "compression": compression
         })
         self._param_dict = param_dict
         self._fh = None
+        self._data_group = None
         self._attached_ = False
+        self._reset_buffers()
 
     def _initialize(self, communicator):
         if communicator is None or communicator.rank == 0:
-            self._fh = h5py.File(self.filename, mode=self.mode)
+            # The 1.10 file format indexes chunks of datasets with a single
+            # unlimited dimension with extensible arrays which are cheaper to
+            # append to than the version 1 B-trees.
+            self._fh = h5py.File(self.filename,
+                                 mode=self.mode,
+                                 libver=("v110", "latest"),
+                                 rdcc_nbytes=self._CHUNK_CACHE_SIZE,
+                                 rdcc_nslots=self._CHUNK_CACHE_SLOTS)
         else:
             self._fh = None
-        self._validate_scheme()
-        self._frame = self._find_frame()
+        # Keep the group open with the file to avoid a path lookup per write.
+        if self._fh is not None:
+            self._data_group, self._frame = self._open_data_group()
+            _open_hdf5_writers.add(self)
+        else:
+            self._frame = None
 
     def __del__(self):
         """Closes file upon destruction."""
         if getattr(self, "_fh", None) is not None:
-            self._fh.close()
+            self._close()
 
     def _setattr_param(self, attr, value):
         """Makes self._param_dict attributes read only."""
@@ -135,29 +200,113 @@ class _HDF5LogInternal(custom._InternalAction):
     def detach(self):
         self._attached_ = False
         if self._fh is not None:
-            self._fh.close()
+            self._close()
 
     def act(self, timestep):
         """Write a new frame of logger data to the HDF5 file."""
-        log_dict = util._dict_flatten(self.logger.log())
+        # Querying the logger is MPI collective, only the root rank writes.
+        log = self.logger.log()
         if self._fh is None:
             return
+        log_dict = util._dict_flatten(log)
         if self._frame == 0:
             self._initialize_datasets(log_dict)
+        if self._buffers is None:
+            self._initialize_buffers(log_dict)
+        buffers = self._buffers
+        index = self._buffered_frames
+        n_written = 0
         for key, (value, category) in log_dict.items():
-            if logging.LoggerCategories[category] in self._reject_categories:
-                continue
+            entry = buffers.get(key)
+            if entry is None:
+                if (logging.LoggerCategories[category]
+                        in self._reject_categories):
+                    continue
+                raise RuntimeError(
+                    "The logged quantities cannot change within a file.")
+            dataset, buffer = entry
             if value is None:
+                value = dataset.fillvalue
+            buffer[index] = value
+            n_written += 1
+        # Quantities removed from the logger would otherwise leave
+        # uninitialized values in their buffers.
+        if n_written != len(buffers):
+            for key, (dataset, buffer) in buffers.items():
+                if key not in log_dict:
+                    buffer[index] = dataset.fillvalue
+        self._buffered_frames += 1
+        self._frame += 1
+        # Write at multiples of the capacity so that batches (even when
+        # appending to an existing file) begin and end on chunk boundaries.
+        if self._frame % self._buffer_capacity == 0:
+            self._write_buffers()
+
+    def _reset_buffers(self):
+        self._buffers = None
+        self._buffered_frames = 0
+        self._buffer_capacity = 0
+
+    @_skip_fh
+    def _initialize_buffers(self, log_dict):
+        """Allocate in memory buffers for the frames of each dataset.
+
+        Frames are written to the file together once the buffers are full or
+        the file is flushed. This replaces a resize and small write of every
+        dataset each frame with a single larger write. The number of buffered
+        frames is limited by ``maximum_write_buffer_size`` and never exceeds
+        the scalar chunk size. The capacity is a power of two so that it evenly
+        divides, or is a multiple of, the number of frames in each chunk.
+        """
+        buffers = {}
+        frame_nbytes = 0
+        for key, (_, category) in log_dict.items():
+            if logging.LoggerCategories[category] in self._reject_categories:
                 continue
-            str_key = "/".join(("hoomd-data",) + key)
-            if str_key not in self._fh:
+            dataset = self._data_group.get("/".join(key))
+            if dataset is None:
                 raise RuntimeError(
                     "The logged quantities cannot change within a file.")
-            dataset = self._fh[str_key]
-            dataset.resize(self._frame + 1, axis=0)
-            dataset[self._frame, ...] = value
-        self._frame += 1
-        self._fh["hoomd-data"].attrs["frames"] = self._frame
+            buffers[key] = dataset
+            frame_nbytes += dataset.dtype.itemsize * int(
+                np.prod(dataset.shape[1:]))
+        capacity = min(self._SCALAR_CHUNK,
+                       self.maximum_write_buffer_size // max(frame_nbytes, 1))
+        self._buffer_capacity = _floor_power_of_two(capacity)
+        # Key the buffers by the logger's own keys so that writing a frame
+        # needs neither the dataset path nor the category.
+        self._buffers = {}
+        for key, dataset in buffers.items():
+            buffer = np.empty((self._buffer_capacity,) + dataset.shape[1:],
+                              dtype=dataset.dtype)
+            self._buffers[key] = (dataset, buffer)
+        self._buffered_frames = 0
+
+    @_skip_fh
+    def _write_buffers(self):
+        """Write all buffered frames to the file."""
+        n_frames = self._buffered_frames
+        if n_frames == 0:
+            return
+        start = self._frame - n_frames
+        for dataset, buffer in self._buffers.values():
+            dataset.resize(start + n_frames, axis=0)
+            # write_direct skips the index parsing and dtype negotiation in
+            # Dataset.__setitem__, the buffer already has the dataset's dtype.
+            dataset.write_direct(buffer, np.s_[:n_frames],
+                                 np.s_[start:start + n_frames])
+        self._buffered_frames = 0
+        # modify overwrites the existing attribute in place where assignment
+        # would delete and recreate it.
+        self._data_group.attrs.modify("frames", self._frame)
+
+    def _close(self):
+        _open_hdf5_writers.discard(self)
+        self._write_buffers()
+        self._fh.close()
+        self._fh = None
+        self._data_group = None
+        self._reset_buffers()
 
     @_skip_fh
     def flush(self):
@@ -179,16 +328,24 @@ class _HDF5LogInternal(custom._InternalAction):
                 if hasattr(writer, 'flush'):
                     writer.flush()
         """
+        self._write_buffers()
         self._fh.flush()
 
     @_skip_fh
-    def _create_dataset(self, key: str, shape, dtype, chunk_size):
+    def _create_dataset(self,
+                        key: str,
+                        shape,
+                        dtype,
+                        chunk_size,
+                        compression=None):
         self._fh.create_dataset(
             key,
             shape,
             dtype=dtype,
             chunks=chunk_size,
             maxshape=(None,) + shape[1:],
+            compression=compression,
+            shuffle=compression is not None,
         )
 
     @_skip_fh
@@ -202,11 +359,28 @@ class _HDF5LogInternal(custom._InternalAction):
 
         Tests were done on 1,000 frame files for writes and reads and tested for
         writing and reading speed.
+
+        The number of frames per chunk is a power of two so that the buffered
+        writes always cover whole chunks. Arrays with more than 1 MiB per frame
+        are split along their leading axes (e.g. the particle index) into
+        chunks of at most 1 MiB. This keeps chunks within the chunk cache and
+        allows reading the history of a subset of the array without reading
+        every whole frame.
+
+        Only array datasets are compressed, scalar chunks are too small to
+        benefit.
+
+        Datasets are created without frames and grow as buffered frames are
+        written. Existing datasets are kept, these remain when a previous run
+        stopped before writing its first frames.
         """
         for key, (value, category) in log_dict.items():
+            if self._data_group.get("/".join(key)) is not None:
+                continue
             chunk_size = None
+            compression = None
             if category == "scalar":
-                data_shape = (1,)
+                data_shape = (0,)
                 if isinstance(value, (np.number, np.bool_)):
                     dtype = value.dtype
                 elif isinstance(value, int):
@@ -217,34 +391,45 @@ class _HDF5LogInternal(custom._InternalAction):
             else:
                 if not isinstance(value, np.ndarray):
                     value = np.asarray(value)
-                data_shape = (1,) + value.shape
+                if value.size == 0:
+                    raise RuntimeError(
+                        f"Cannot log the empty array {'/'.join(key)}.")
+                data_shape = (0,) + value.shape
                 dtype = value.dtype
-                chunk_size = (max(
-                    self._MULTIFRAME_ARRAY_CHUNK_MAXIMUM // value.nbytes,
-                    1),) + data_shape[1:]
+                chunk_size = (_floor_power_of_two(
+                    self._MULTIFRAME_ARRAY_CHUNK_MAXIMUM
+                    // value.nbytes),) + data_shape[1:]
+                if value.nbytes > self._SPLIT_ARRAY_CHUNK_MAXIMUM:
+                    chunk_size = (1,) + _split_chunk_shape(
+                        value.shape, value.nbytes,
+                        self._SPLIT_ARRAY_CHUNK_MAXIMUM)
+                compression = self.compression
             self._create_dataset("/".join(("hoomd-data",) + key), data_shape,
-                                 dtype, chunk_size)
+                                 dtype, chunk_size, compression)
 
     @_skip_fh
-    def _find_frame(self):
-        if "hoomd-data" in self._fh:
-            return self._fh["hoomd-data"].attrs["frames"]
-        return 0
-
-    @_skip_fh
-    def _validate_scheme(self):
-        if "hoomd-data" in self._fh:
-            if "hoomd-schema" not in self._fh["hoomd-data"].attrs:
-                raise RuntimeError("Validation of existing HDF5 file failed.")
-        else:
+    def _open_data_group(self):
+        """Validate or create the data group and find the number of frames."""
+        group = self._fh.get("hoomd-data")
+        if group is None:
             group = self._fh.create_group("hoomd-data")
             group.attrs["hoomd-schema"] = [0, 1]
             group.attrs["frames"] = 0
+            return group, 0
+        # Read all the attributes at once rather than one lookup at a time.
+        attrs = dict(group.attrs)
+        if "hoomd-schema" not in attrs:
+            raise RuntimeError("Validation of existing HDF5 file failed.")
+        return group, attrs["frames"]
 
     def __getstate__(self):
         state = copy.copy(self.__dict__)
         del state["_fh"]
+        state["_data_group"] = None
         state["_attached_"] = False
+        state["_buffers"] = None
+        state["_buffered_frames"] = 0
+        state["_buffer_capacity"] = 0
         return state
 
     def __setstate__(self, state):
@@ -259,6 +444,10 @@ class HDF5Log(_InternalCustomWriter):
     Note:
         This class requires that ``h5py`` be installed.
 
+    Note:
+        `HDF5Log` writes files in the HDF5 1.10 file format. Reading them
+        requires HDF5 1.10 or newer.
+
     Important:
         The HDF5 file can be used for other data storage; however, the
         "hoomd-data" key is reserved for use by this class. An exception will be
@@ -267,6 +456,12 @@ class HDF5Log(_InternalCustomWriter):
     Warning:
         This class cannot handle string, strings, or object loggables.
 
+    Warning:
+        `HDF5Log` buffers writes in memory. Abnormal exits (e.g. ``kill``,
+        ``scancel``, reaching walltime limits) may cause loss of data. Ensure
+        that your scripts exit cleanly and call `flush()` as needed to write
+        buffered frames to the file.
+
     Args:
         trigger (hoomd.trigger.trigger_like): The trigger to determine when to
             write to the HDF5 file.
@@ -276,6 +471,12 @@ class HDF5Log(_InternalCustomWriter):
         mode (`str`, optional): The mode to open the file in. Available values
             are "w", "x" and "w-", "a", and "r+". Defaults to "a". See the
             h5py_ documentation for more details).
+        maximum_write_buffer_size (`int`, optional): Size (in bytes) to buffer
+            in memory before writing to the file. Defaults to 64 MiB.
+        compression (`str`, optional): The compression filter to apply to
+            array quantities, either "gzip", "lzf", or `None` for no
+            compression. Scalar quantities are not compressed. Defaults to
+            `None`.
 
     .. _h5py:
         https://docs.h5py.org/en/stable/high/file.html#opening-creating-files
@@ -328,6 +529,24 @@ class HDF5Log(_InternalCustomWriter):
             .. code-block:: python
 
                 mode = hdf5_log.mode
+
+        maximum_write_buffer_size (int): Size (in bytes) to buffer in memory
+            before writing to the file (*read only*).
+
+            .. rubric:: Example:
+
+            .. code-block:: python
+
+                maximum_write_buffer_size = hdf5_log.maximum_write_buffer_size
+
+        compression (str): The compression filter applied to array quantities
+            (*read only*).
+
+            .. rubric:: Example:
+
+            .. code-block:: python
+
+                compression = hdf5_log.compression
     """
     _internal_class = _HDF5LogInternal
     _wrap_methods = ("flush",)